@@ -0,0 +1,53 @@
+"""
+Micro-benchmarks for the CommandProcessor.process_command hot path.
+Not part of the default test run; run them with
+``pytest src/ifw/tests/benchmarks``. Skipped unless pytest-benchmark is installed.
+"""
+
+import pytest
+
+from ifw.cli.command_processor import CommandProcessor
+
+pytest.importorskip("pytest_benchmark")
+
+
+class BenchHandler:
+    """Minimal handler with fixed routing and result."""
+
+    __slots__ = ("accepts", "raises")
+
+    def __init__(self, accepts=True, raises=False):
+        self.accepts = accepts
+        self.raises = raises
+
+    def can_handle(self, user_input: str) -> bool:
+        if self.raises:
+            raise ValueError("can_handle failed")
+        return self.accepts
+
+    def handle(self, user_input: str) -> bool:
+        return True
+
+
+def test_bench_single_handler(benchmark, dummy_console):
+    """Benchmark a command routed to the only handler."""
+    processor = CommandProcessor([BenchHandler()], dummy_console)
+
+    assert benchmark(processor.process_command, "hello") is True
+
+
+def test_bench_10_handlers_fallthrough(benchmark, dummy_console):
+    """Benchmark a command that falls through nine declining handlers."""
+    handlers = [BenchHandler(accepts=False) for _ in range(9)] + [BenchHandler()]
+    processor = CommandProcessor(handlers, dummy_console)
+
+    assert benchmark(processor.process_command, "cmd") is True
+
+
+def test_bench_can_handle_exception_fallthrough(benchmark, dummy_console):
+    """Benchmark a command that skips a handler raising in can_handle."""
+    processor = CommandProcessor(
+        [BenchHandler(raises=True), BenchHandler()], dummy_console
+    )
+
+    assert benchmark(processor.process_command, "cmd") is True
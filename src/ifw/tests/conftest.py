@@ -0,0 +1,20 @@
+"""
+Fixtures shared by the unit tests and the benchmarks.
+"""
+
+import pytest
+
+
+class _DummyConsole:
+    """Console stand-in that accepts and discards any method call."""
+
+    __slots__ = ()
+
+    def __getattr__(self, _name):
+        return lambda *args, **kwargs: None
+
+
+@pytest.fixture(scope="session")
+def dummy_console():
+    """Provide a console that discards output, so printing costs nothing."""
+    return _DummyConsole()
@@ -0,0 +1,269 @@
+"""
+Shared mocks and fixtures for CLI unit tests.
+Provides mocked CLIController dependencies and ready-built controllers.
+"""
+
+from collections import deque
+
+import pytest
+
+from ifw.cli import controller as _controller
+from ifw.cli.controller import CLIController
+
+
+class MockAgent:
+    """Mock agent for testing."""
+
+    __slots__ = ("messages", "call_count")
+
+    def __init__(self):
+        self.messages = []
+        self.call_count = 0
+
+    def __call__(self, user_input):
+        self.call_count += 1
+        return f"AI response to: {user_input}"
+
+
+class MockShellExecutor:
+    """Mock shell executor for testing."""
+
+    __slots__ = ("executed_commands", "interrupt_called", "should_interrupt")
+
+    def __init__(self):
+        self.executed_commands = []
+        self.interrupt_called = False
+        self.should_interrupt = True
+
+    def execute_shell_command(self, command):
+        self.executed_commands.append(command)
+        return f"Output of: {command}"
+
+    def interrupt_current_command(self):
+        self.interrupt_called = True
+        return self.should_interrupt
+
+
+class MockShellDetector:
+    """Mock shell detector for testing."""
+
+    __slots__ = ("is_shell_responses",)
+
+    def __init__(self):
+        self.is_shell_responses = {}
+
+    def is_shell_command(self, command):
+        return self.is_shell_responses.get(command, False)
+
+    def set_shell_command(self, command, is_shell=True):
+        self.is_shell_responses[command] = is_shell
+
+
+class MockSessionManager:
+    """Mock session manager for testing."""
+
+    __slots__ = (
+        "input_queue",
+        "context",
+        "shell_executor",
+        "console",
+    )
+
+    def __init__(self, shell_executor=None, console=None):
+        self.input_queue = deque()
+        self.context = {"username": "testuser", "cwd": "/test"}
+        self.shell_executor = shell_executor
+        self.console = console
+
+    def get_user_input(self):
+        try:
+            result = self.input_queue.popleft()
+        except IndexError:
+            raise EOFError("No more input")
+        # Queued exceptions simulate Ctrl+C / Ctrl+D at the prompt
+        if isinstance(result, BaseException):
+            raise result
+        return result
+
+    def add_input(self, user_input):
+        self.input_queue.append(user_input)
+
+    def get_context(self):
+        return self.context
+
+    def get_session_info(self):
+        return {"commands_run": 0}
+
+    def force_context_refresh(self):
+        pass
+
+
+def _as_callable(result):
+    """Return ``result`` if callable, else a function that always returns it."""
+    if callable(result):
+        return result
+    return lambda _user_input: result
+
+
+class MockHandler:
+    """Mock handler for testing."""
+
+    __slots__ = (
+        "name",
+        "can_handle_result",
+        "handle_result",
+        "handled_commands",
+        "can_handle_calls",
+        "_can_handle",
+        "_handle",
+    )
+
+    def __init__(self, name, can_handle_result=True, handle_result=True):
+        self.name = name
+        self.can_handle_result = can_handle_result
+        self.handle_result = handle_result
+        self.handled_commands = []
+        self.can_handle_calls = []
+        # Resolve fixed results vs. callables once instead of on every call
+        self._can_handle = _as_callable(can_handle_result)
+        self._handle = _as_callable(handle_result)
+
+    def can_handle(self, user_input):
+        self.can_handle_calls.append(user_input)
+        return self._can_handle(user_input)
+
+    def handle(self, user_input):
+        self.handled_commands.append(user_input)
+        return self._handle(user_input)
+
+
+class MockCommandProcessor:
+    """Mock command processor for testing."""
+
+    __slots__ = ("processed_commands", "handlers", "console", "should_raise", "stats")
+
+    _STATS_TEMPLATE = {
+        "total_commands": 0,
+        "successful_commands": 0,
+        "failed_commands": 0,
+        "success_rate": 100.0,
+        "handler_stats": {},
+    }
+
+    def __init__(self, handlers=None, console=None):
+        self.processed_commands = []
+        self.handlers = handlers or []
+        self.console = console
+        self.should_raise = None
+        self.reset_stats()
+
+    def process_command(self, user_input):
+        self.processed_commands.append(user_input)
+        self.stats["total_commands"] += 1
+
+        if self.should_raise:
+            raise self.should_raise
+
+        self.stats["successful_commands"] += 1
+        return True
+
+    def get_processing_stats(self):
+        return self.stats.copy()
+
+    def reset_stats(self):
+        self.stats = dict(self._STATS_TEMPLATE)
+        self.stats["handler_stats"] = {}  # don't share the template's inner dict
+
+    def add_handler(self, handler, position=None):
+        if position is None:
+            self.handlers.append(handler)
+        else:
+            self.handlers.insert(position, handler)
+
+    def remove_handler(self, handler_class):
+        for i, handler in enumerate(self.handlers):
+            if isinstance(handler, handler_class):
+                self.handlers.pop(i)
+                return True
+        return False
+
+    def list_handlers(self):
+        return [h.__class__.__name__ for h in self.handlers]
+
+
+# Mock implementations that will replace real classes
+def mock_session_manager_factory(shell_executor, console):
+    return MockSessionManager(shell_executor, console)
+
+
+def mock_command_processor_factory(handlers, console):
+    return MockCommandProcessor(handlers, console)
+
+
+def mock_shell_executor_factory():
+    return MockShellExecutor()
+
+
+def mock_shell_detector_factory():
+    return MockShellDetector()
+
+
+def mock_control_handler_factory(shell_executor, console):
+    return MockHandler("ControlHandler")
+
+
+def mock_shell_handler_factory(agent, shell_executor, shell_detector, console):
+    return MockHandler("ShellHandler")
+
+
+def mock_ai_handler_factory(agent, shell_executor, console):
+    return MockHandler("AIHandler")
+
+
+# (controller attribute, replacement) pairs patched into ifw.cli.controller
+_PATCHES = (
+    ("SessionManager", mock_session_manager_factory),
+    ("CommandProcessor", mock_command_processor_factory),
+    ("ShellCommandExecutor", mock_shell_executor_factory),
+    ("ShellCommandDetector", mock_shell_detector_factory),
+    ("ControlCommandHandler", mock_control_handler_factory),
+    ("ShellCommandHandler", mock_shell_handler_factory),
+    ("AIRequestHandler", mock_ai_handler_factory),
+)
+
+
+def _patch_controller_deps(monkeypatch):
+    """Replace every controller dependency with its mock factory."""
+    for name, factory in _PATCHES:
+        monkeypatch.setattr(_controller, name, factory)
+
+
+# Fixtures
+@pytest.fixture
+def mock_handler_cls():
+    """Provide the MockHandler class for tests that build or remove handlers."""
+    return MockHandler
+
+
+@pytest.fixture
+def mock_agent():
+    """Provide a fresh mock agent for tests that check its state."""
+    return MockAgent()
+
+
+@pytest.fixture(scope="session")
+def console(dummy_console):
+    """Provide a console shared by all tests; tests only print to it."""
+    return dummy_console
+
+
+@pytest.fixture
+def patch_controller_deps(monkeypatch):
+    """Patch all controller dependencies with mocks for the current test."""
+    _patch_controller_deps(monkeypatch)
+
+
+@pytest.fixture
+def mock_cli_controller(patch_controller_deps, mock_agent, console):
+    """Provide a CLIController built on mocked dependencies."""
+    return CLIController(agent=mock_agent, console=console)
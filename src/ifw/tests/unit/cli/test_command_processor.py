@@ -1,11 +1,12 @@
 """
 Comprehensive unit test suite for CommandProcessor class.
 Uses pure pytest without any unittest or mock imports.
+Module-level handlers and the module-scoped processor are only read, never used
+to process commands, and each pytest-xdist worker is its own process, so the
+module can run under ``pytest -n auto``.
 """
 
 import pytest
-from rich.console import Console
-from io import StringIO
 
 # Import the classes to test
 from ifw.cli.command_processor import (
@@ -15,96 +16,99 @@ from ifw.cli.command_processor import (
 )
 
 
+def _raiser(exception):
+    """Return a callable that raises ``exception`` whatever it is called with."""
+
+    def raise_exception(user_input):
+        raise exception
+
+    return raise_exception
+
+
 class SimpleHandler:
     """Simple handler for testing - no complex mocking."""
 
+    __slots__ = (
+        "name",
+        "accepts_all",
+        "always_succeeds",
+        "handled_commands",
+        "can_handle_calls",
+        "_can_handle_impl",
+        "_handle_impl",
+    )
+
     def __init__(self, name: str, accepts_all=True, always_succeeds=True):
         self.name = name
         self.accepts_all = accepts_all
         self.always_succeeds = always_succeeds
         self.handled_commands = []
         self.can_handle_calls = []
-        self._custom_can_handle = None
-        self._custom_handle = None
-        self._should_raise_on_can_handle = None
-        self._should_raise_on_handle = None
+        # Active behaviour is bound once here and replaced by the setters below
+        self._can_handle_impl = self._default_can_handle
+        self._handle_impl = self._default_handle
+
+    def _default_can_handle(self, user_input: str) -> bool:
+        return self.accepts_all
+
+    def _default_handle(self, user_input: str) -> bool:
+        return self.always_succeeds
 
     def set_custom_can_handle(self, func):
         """Set custom can_handle logic."""
-        self._custom_can_handle = func
+        self._can_handle_impl = func
 
     def set_custom_handle(self, func):
         """Set custom handle logic."""
-        self._custom_handle = func
+        self._handle_impl = func
 
     def set_can_handle_exception(self, exception):
         """Set exception to raise in can_handle."""
-        self._should_raise_on_can_handle = exception
+        self._can_handle_impl = _raiser(exception)
 
     def set_handle_exception(self, exception):
         """Set exception to raise in handle."""
-        self._should_raise_on_handle = exception
+        self._handle_impl = _raiser(exception)
 
     def can_handle(self, user_input: str) -> bool:
         """Determine if this handler can process the input."""
         self.can_handle_calls.append(user_input)
-
-        if self._should_raise_on_can_handle:
-            raise self._should_raise_on_can_handle
-
-        if self._custom_can_handle:
-            return self._custom_can_handle(user_input)
-
-        return self.accepts_all
+        return self._can_handle_impl(user_input)
 
     def handle(self, user_input: str) -> bool:
         """Process the input."""
         self.handled_commands.append(user_input)
-
-        if self._should_raise_on_handle:
-            raise self._should_raise_on_handle
-
-        if self._custom_handle:
-            return self._custom_handle(user_input)
-
-        return self.always_succeeds
-
-
-# Different handler classes for testing
-class HandlerTypeA(SimpleHandler):
-    pass
+        return self._handle_impl(user_input)
 
 
-class HandlerTypeB(SimpleHandler):
-    pass
+# Handler subclasses keyed by name, so each handler type gets a distinct class name
+_handler_classes = {}
 
 
-class HandlerTypeC(SimpleHandler):
-    pass
+def _handler_cls(name: str) -> type:
+    """Return the SimpleHandler subclass called ``name``, creating it once."""
+    if name not in _handler_classes:
+        _handler_classes[name] = type(name, (SimpleHandler,), {"__slots__": ()})
+    return _handler_classes[name]
 
 
-class HandlerTypeD(SimpleHandler):
-    pass
+# Shared handlers for tests that only read processor state. Tests that
+# process commands must build fresh handlers, since handlers record calls.
+_RO_HANDLER_A = _handler_cls("HandlerTypeA")("HandlerTypeA")
+_RO_HANDLER_B = _handler_cls("HandlerTypeB")("HandlerTypeB")
 
 
 # Fixtures
 @pytest.fixture
-def console():
-    """Provide a console for testing."""
-    return Console()
+def handler_factory():
+    """Provide a factory building handlers of a named handler type."""
+    return lambda cls_name, **kwargs: _handler_cls(cls_name)(cls_name, **kwargs)
 
 
 @pytest.fixture
-def string_console():
-    """Provide a console that captures output."""
-    string_io = StringIO()
-    return Console(file=string_io, force_terminal=False)
-
-
-@pytest.fixture
-def basic_handler():
+def basic_handler(handler_factory):
     """Provide a basic handler."""
-    return HandlerTypeA("TestHandler")
+    return handler_factory("HandlerTypeA")
 
 
 @pytest.fixture
@@ -113,14 +117,48 @@ def processor(console, basic_handler):
     return CommandProcessor([basic_handler], console)
 
 
+@pytest.fixture(scope="module")
+def empty_processor(console):
+    """Provide a processor without handlers; tests must not mutate it."""
+    return CommandProcessor([], console)
+
+
+# (handlers as (name, accepts_all, always_succeeds), input, index of expected handler)
+SCENARIOS = [
+    ([("HandlerTypeA", True, True)], "test command", 0),
+    ([("HandlerTypeA", True, True), ("HandlerTypeB", True, True)], "test", 0),
+    ([("HandlerTypeA", False, True), ("HandlerTypeB", True, True)], "test", 1),
+    (
+        [
+            ("HandlerTypeA", False, True),
+            ("HandlerTypeB", True, True),
+            ("HandlerTypeC", True, True),
+        ],
+        "test",
+        1,
+    ),
+]
+
+
+@pytest.fixture(
+    params=SCENARIOS, ids=["single", "first_wins", "skip_first", "skip_first_of_three"]
+)
+def scenario(request, console):
+    """Provide (processor, input, expected handler index) for a routing scenario."""
+    specs, user_input, expected_index = request.param
+    handlers = [
+        _handler_cls(name)(name, accepts_all=accepts, always_succeeds=succeeds)
+        for name, accepts, succeeds in specs
+    ]
+    return CommandProcessor(handlers, console), user_input, expected_index
+
+
 class TestCommandProcessorInitialization:
     """Test CommandProcessor initialization."""
 
     def test_init_with_handlers_and_console(self, console):
         """Test normal initialization."""
-        handler1 = HandlerTypeA("Handler1")
-        handler2 = HandlerTypeB("Handler2")
-        handlers = [handler1, handler2]
+        handlers = [_RO_HANDLER_A, _RO_HANDLER_B]
 
         processor = CommandProcessor(handlers, console)
 
@@ -129,22 +167,16 @@ class TestCommandProcessorInitialization:
         assert processor.commands_processed == 0
         assert processor.successful_commands == 0
         assert processor.failed_commands == 0
-        assert len(processor.handler_stats) == 2
-        assert "HandlerTypeA" in processor.handler_stats
-        assert "HandlerTypeB" in processor.handler_stats
+        assert processor.handler_stats.keys() == {"HandlerTypeA", "HandlerTypeB"}
 
-    def test_init_with_empty_handlers(self, console):
+    def test_init_with_empty_handlers(self, empty_processor):
         """Test initialization with empty handlers list."""
-        processor = CommandProcessor([], console)
-
-        assert processor.handlers == []
-        assert processor.handler_stats == {}
+        assert empty_processor.handlers == []
+        assert empty_processor.handler_stats == {}
 
     def test_handler_stats_initialization(self, console):
         """Test that handler statistics are properly initialized."""
-        handler = HandlerTypeA("TestHandler")
-
-        processor = CommandProcessor([handler], console)
+        processor = CommandProcessor([_RO_HANDLER_A], console)
 
         expected_stats = {
             "HandlerTypeA": {  # Note: uses actual class name
@@ -159,19 +191,21 @@ class TestCommandProcessorInitialization:
 class TestCommandProcessing:
     """Test the main command processing functionality."""
 
-    def test_successful_command_processing(self, processor, basic_handler):
-        """Test successful command processing."""
-        result = processor.process_command("test command")
+    def test_command_routing(self, scenario):
+        """Test that the first accepting handler, and only it, processes the command."""
+        processor, user_input, expected_index = scenario
 
-        assert result is True
+        assert processor.process_command(user_input) is True
         assert processor.commands_processed == 1
         assert processor.successful_commands == 1
         assert processor.failed_commands == 0
-        assert basic_handler.handled_commands == ["test command"]
+        for index, handler in enumerate(processor.handlers):
+            expected = [user_input] if index == expected_index else []
+            assert handler.handled_commands == expected
 
-    def test_failed_command_processing(self, console):
+    def test_failed_command_processing(self, console, handler_factory):
         """Test command processing that fails."""
-        handler = HandlerTypeB("FailHandler", always_succeeds=False)
+        handler = handler_factory("HandlerTypeB", always_succeeds=False)
         processor = CommandProcessor([handler], console)
 
         result = processor.process_command("test command")
@@ -181,36 +215,12 @@ class TestCommandProcessing:
         assert processor.successful_commands == 0
         assert processor.failed_commands == 1
 
-    def test_handler_priority_order(self, console):
-        """Test that handlers are tried in order."""
-        handler1 = HandlerTypeA("Handler1", accepts_all=False)
-        handler2 = HandlerTypeB("Handler2", accepts_all=True)
-        handler3 = HandlerTypeC("Handler3", accepts_all=True)
-
-        processor = CommandProcessor([handler1, handler2, handler3], console)
-
-        processor.process_command("test")
-
-        # Only handler2 should have processed the command
-        assert handler1.handled_commands == []
-        assert handler2.handled_commands == ["test"]
-        assert handler3.handled_commands == []
-
-    def test_invalid_input_none(self, processor):
-        """Test handling of None input."""
-        result = processor.process_command(None)
-        assert result is False
-        assert processor.commands_processed == 0
-
-    def test_invalid_input_non_string(self, processor):
-        """Test handling of non-string input."""
-        result = processor.process_command(123)
-        assert result is False
-        assert processor.commands_processed == 0
-
-    def test_empty_string_input(self, processor):
-        """Test handling of empty string input."""
-        result = processor.process_command("")
+    @pytest.mark.parametrize(
+        "bad_input", [None, 123, ""], ids=["none", "non_string", "empty"]
+    )
+    def test_invalid_inputs(self, processor, bad_input):
+        """Test handling of None, non-string and empty input."""
+        result = processor.process_command(bad_input)
         assert result is False
         assert processor.commands_processed == 0
 
@@ -225,9 +235,9 @@ class TestCommandProcessing:
 class TestErrorHandling:
     """Test error handling scenarios."""
 
-    def test_no_handler_found_error(self, console):
+    def test_no_handler_found_error(self, console, handler_factory):
         """Test NoHandlerFoundError when no handler can process command."""
-        handler = HandlerTypeA("TestHandler", accepts_all=False)
+        handler = handler_factory("HandlerTypeA", accepts_all=False)
         processor = CommandProcessor([handler], console)
 
         with pytest.raises(NoHandlerFoundError) as exc_info:
@@ -237,12 +247,12 @@ class TestErrorHandling:
         # Exception is raised before failed_commands can be incremented
         assert processor.failed_commands == 0
 
-    def test_handler_can_handle_exception(self, console):
+    def test_handler_can_handle_exception(self, console, handler_factory):
         """Test handling of exceptions in can_handle method."""
-        handler1 = HandlerTypeA("FailingHandler")
+        handler1 = handler_factory("HandlerTypeA")
         handler1.set_can_handle_exception(ValueError("Handler check failed"))
 
-        handler2 = HandlerTypeB("WorkingHandler")
+        handler2 = handler_factory("HandlerTypeB")
         processor = CommandProcessor([handler1, handler2], console)
 
         result = processor.process_command("test")
@@ -251,9 +261,9 @@ class TestErrorHandling:
         assert result is True
         assert handler2.handled_commands == ["test"]
 
-    def test_handler_execution_exception(self, console):
+    def test_handler_execution_exception(self, console, handler_factory):
         """Test handling of exceptions during command execution."""
-        handler = HandlerTypeA("FailingHandler")
+        handler = handler_factory("HandlerTypeA")
         handler.set_handle_exception(RuntimeError("Handler execution failed"))
 
         processor = CommandProcessor([handler], console)
@@ -264,15 +274,17 @@ class TestErrorHandling:
         assert "Handler HandlerTypeA failed to process command" in str(exc_info.value)
         assert processor.failed_commands == 1
 
-    def test_multiple_handlers_with_can_handle_exceptions(self, console):
+    def test_multiple_handlers_with_can_handle_exceptions(
+        self, console, handler_factory
+    ):
         """Test that processor continues through handlers even if some raise exceptions."""
-        handler1 = HandlerTypeA("Failing1")
+        handler1 = handler_factory("HandlerTypeA")
         handler1.set_can_handle_exception(ValueError("First fails"))
 
-        handler2 = HandlerTypeB("Failing2")
+        handler2 = handler_factory("HandlerTypeB")
         handler2.set_can_handle_exception(RuntimeError("Second fails"))
 
-        handler3 = HandlerTypeC("Working", accepts_all=True)
+        handler3 = handler_factory("HandlerTypeC", accepts_all=True)
 
         processor = CommandProcessor([handler1, handler2, handler3], console)
 
@@ -282,38 +294,47 @@ class TestErrorHandling:
         assert handler3.handled_commands == ["test"]
 
 
+# (commands processed, handler succeeds, expected success rate)
+_BATCH_CASES = [
+    (1, True, 100.0),
+    (2, True, 100.0),
+    (5, True, 100.0),
+    (1, False, 0.0),
+    (3, False, 0.0),
+]
+
+
 class TestStatistics:
     """Test statistics tracking functionality."""
 
-    def test_stats_update_on_success(self, processor, basic_handler):
-        """Test statistics updates on successful command processing."""
-        processor.process_command("test1")
-        processor.process_command("test2")
-
-        stats = processor.get_processing_stats()
-        assert stats["total_commands"] == 2
-        assert stats["successful_commands"] == 2
-        assert stats["failed_commands"] == 0
-        assert stats["success_rate"] == 100.0
-        assert stats["handler_stats"]["HandlerTypeA"]["processed"] == 2
-        assert stats["handler_stats"]["HandlerTypeA"]["successful"] == 2
-        assert stats["handler_stats"]["HandlerTypeA"]["failed"] == 0
-
-    def test_stats_update_on_failure(self, console):
-        """Test statistics updates on failed command processing."""
-        handler = HandlerTypeA("TestHandler", always_succeeds=False)
+    @pytest.mark.parametrize("n, succeeds, expected_rate", _BATCH_CASES)
+    def test_stats_after_batch(
+        self, console, handler_factory, n, succeeds, expected_rate
+    ):
+        """Test statistics updates after a batch of successful or failed commands."""
+        handler = handler_factory("HandlerTypeA", always_succeeds=succeeds)
         processor = CommandProcessor([handler], console)
 
-        processor.process_command("test")
+        for i in range(n):
+            processor.process_command(f"test{i}")
 
+        assert len(handler.handled_commands) == n
+        successful = n if succeeds else 0
         stats = processor.get_processing_stats()
-        assert stats["total_commands"] == 1
-        assert stats["successful_commands"] == 0
-        assert stats["failed_commands"] == 1
-        assert stats["success_rate"] == 0.0
-        assert stats["handler_stats"]["HandlerTypeA"]["processed"] == 1
-        assert stats["handler_stats"]["HandlerTypeA"]["successful"] == 0
-        assert stats["handler_stats"]["HandlerTypeA"]["failed"] == 1
+        expected = {
+            "total_commands": n,
+            "successful_commands": successful,
+            "failed_commands": n - successful,
+            "success_rate": expected_rate,
+        }
+        assert {key: stats[key] for key in expected} == expected
+        assert stats["handler_stats"] == {
+            "HandlerTypeA": {
+                "processed": n,
+                "successful": successful,
+                "failed": n - successful,
+            }
+        }
 
     def test_stats_reset(self, processor):
         """Test statistics reset functionality."""
@@ -321,16 +342,15 @@ class TestStatistics:
         processor.reset_stats()
 
         stats = processor.get_processing_stats()
-        assert stats["total_commands"] == 0
-        assert stats["successful_commands"] == 0
-        assert stats["failed_commands"] == 0
-        assert stats["handler_stats"]["HandlerTypeA"]["processed"] == 0
-        assert stats["handler_stats"]["HandlerTypeA"]["successful"] == 0
-        assert stats["handler_stats"]["HandlerTypeA"]["failed"] == 0
-
-    def test_success_rate_calculation_mixed_results(self, console):
+        expected = {"total_commands": 0, "successful_commands": 0, "failed_commands": 0}
+        assert {key: stats[key] for key in expected} == expected
+        assert stats["handler_stats"] == {
+            "HandlerTypeA": {"processed": 0, "successful": 0, "failed": 0}
+        }
+
+    def test_success_rate_calculation_mixed_results(self, console, handler_factory):
         """Test success rate calculation with mixed results."""
-        handler = HandlerTypeA("TestHandler")
+        handler = handler_factory("HandlerTypeA")
         processor = CommandProcessor([handler], console)
 
         # Process some commands
@@ -338,6 +358,8 @@ class TestStatistics:
         processor.process_command("test2")
         processor.process_command("test3")
 
+        assert len(handler.handled_commands) == 3
+
         # Manually adjust for testing specific scenario
         processor.successful_commands = 2
         processor.failed_commands = 1
@@ -346,17 +368,17 @@ class TestStatistics:
         expected_rate = (2 / 3) * 100
         assert abs(stats["success_rate"] - expected_rate) < 0.1
 
-    def test_success_rate_calculation_no_commands(self, processor):
+    def test_success_rate_calculation_no_commands(self, empty_processor):
         """Test success rate calculation with no commands processed."""
-        stats = processor.get_processing_stats()
+        stats = empty_processor.get_processing_stats()
         assert stats["success_rate"] == 0.0
 
-    def test_handler_stats_for_multiple_handlers(self, console):
+    def test_handler_stats_for_multiple_handlers(self, console, handler_factory):
         """Test statistics tracking for multiple handlers."""
-        handler1 = HandlerTypeA("Handler1")
+        handler1 = handler_factory("HandlerTypeA")
         handler1.set_custom_can_handle(lambda x: x.startswith("cmd1"))
 
-        handler2 = HandlerTypeB("Handler2")
+        handler2 = handler_factory("HandlerTypeB")
         handler2.set_custom_can_handle(lambda x: x.startswith("cmd2"))
 
         processor = CommandProcessor([handler1, handler2], console)
@@ -364,96 +386,62 @@ class TestStatistics:
         processor.process_command("cmd1 test")
         processor.process_command("cmd2 test")
 
-        stats = processor.get_processing_stats()
-        assert stats["handler_stats"]["HandlerTypeA"]["processed"] == 1
-        assert stats["handler_stats"]["HandlerTypeB"]["processed"] == 1
+        handler_stats = processor.get_processing_stats()["handler_stats"]
+        assert {name: handler_stats[name]["processed"] for name in handler_stats} == {
+            "HandlerTypeA": 1,
+            "HandlerTypeB": 1,
+        }
 
 
 class TestHandlerManagement:
     """Test handler management functionality."""
 
-    def test_add_handler_at_end(self, console):
-        """Test adding handler at the end of the list."""
-        handler1 = HandlerTypeA("Handler1")
-        handler2 = HandlerTypeB("Handler2")
+    def test_handler_mutations(self, console, handler_factory, empty_processor):
+        """Test adding, removing and listing handlers on a single processor."""
+        handler1 = handler_factory("HandlerTypeA")
+        handler2 = handler_factory("HandlerTypeB")
+        handler3 = handler_factory("HandlerTypeC")
         processor = CommandProcessor([handler1], console)
 
-        processor.add_handler(handler2)
-
-        assert len(processor.handlers) == 2
-        assert processor.handlers[1] == handler2
-        assert "HandlerTypeA" in processor.handler_stats
-        assert "HandlerTypeB" in processor.handler_stats
-
-    def test_add_handler_at_position(self, console):
-        """Test adding handler at specific position."""
-        handler1 = HandlerTypeA("Handler1")
-        handler2 = HandlerTypeB("Handler2")
-        handler3 = HandlerTypeC("Handler3")
-        processor = CommandProcessor([handler1, handler3], console)
+        # Append at the end
+        processor.add_handler(handler3)
+        assert processor.handlers == [handler1, handler3]
+        assert processor.handler_stats.keys() == {"HandlerTypeA", "HandlerTypeC"}
 
+        # Insert at a specific position
         processor.add_handler(handler2, position=1)
-
-        assert len(processor.handlers) == 3
-        assert processor.handlers[1] == handler2
-        assert processor.handlers[2] == handler3
-
-    def test_remove_handler_success(self, console):
-        """Test removing handler by class type."""
-        handler1 = HandlerTypeA("HandlerA")
-        handler2 = HandlerTypeB("HandlerB")
-        processor = CommandProcessor([handler1, handler2], console)
+        assert processor.handlers == [handler1, handler2, handler3]
+        assert processor.list_handlers() == [
+            "HandlerTypeA",
+            "HandlerTypeB",
+            "HandlerTypeC",
+        ]
 
         # Remove by class type
-        result = processor.remove_handler(HandlerTypeA)
-
-        assert result is True
-        assert len(processor.handlers) == 1
-        assert processor.handlers[0] == handler2
-        assert "HandlerTypeA" not in processor.handler_stats
-        assert "HandlerTypeB" in processor.handler_stats
-
-    def test_remove_nonexistent_handler(self, console):
-        """Test removing handler that doesn't exist."""
-        handler = HandlerTypeA("Handler1")
-        processor = CommandProcessor([handler], console)
+        assert processor.remove_handler(_handler_cls("HandlerTypeA")) is True
+        assert processor.handlers == [handler2, handler3]
+        assert processor.handler_stats.keys() == {"HandlerTypeB", "HandlerTypeC"}
 
+        # Removing a handler type that is not registered changes nothing
         class NonExistentHandler:
             pass
 
-        result = processor.remove_handler(NonExistentHandler)
-
-        assert result is False
-        assert len(processor.handlers) == 1
-
-    def test_list_handlers(self, console):
-        """Test listing handler names."""
-        handler1 = HandlerTypeA("Handler1")
-        handler2 = HandlerTypeB("Handler2")
-        processor = CommandProcessor([handler1, handler2], console)
-
-        handler_names = processor.list_handlers()
-
-        assert handler_names == ["HandlerTypeA", "HandlerTypeB"]
-
-    def test_list_handlers_empty(self, console):
-        """Test listing handlers when none exist."""
-        processor = CommandProcessor([], console)
-
-        handler_names = processor.list_handlers()
+        assert processor.remove_handler(NonExistentHandler) is False
+        assert processor.list_handlers() == ["HandlerTypeB", "HandlerTypeC"]
 
-        assert handler_names == []
+        # A processor without handlers lists none
+        assert empty_processor.list_handlers() == []
 
 
 class TestDebuggingFeatures:
     """Test debugging and utility features."""
 
-    def test_get_handler_for_input_found(self, console):
+    def test_get_handler_for_input_found(self, console, handler_factory):
         """Test getting handler for specific input."""
-        handler1 = HandlerTypeA("Handler1")
+        handler1 = handler_factory("HandlerTypeA")
         handler1.set_custom_can_handle(lambda x: x.startswith("hello"))
 
-        handler2 = HandlerTypeB("Handler2")
+        handler2 = handler_factory("HandlerTypeB")
         handler2.set_custom_can_handle(lambda x: x.startswith("goodbye"))
 
         processor = CommandProcessor([handler1, handler2], console)
@@ -464,17 +452,17 @@ class TestDebuggingFeatures:
         result_handler = processor.get_handler_for_input("goodbye world")
         assert result_handler == handler2
 
-    def test_get_handler_for_input_not_found(self, console):
+    def test_get_handler_for_input_not_found(self, console, handler_factory):
         """Test getting handler when no handler can handle input."""
-        handler = HandlerTypeA("Handler", accepts_all=False)
+        handler = handler_factory("HandlerTypeA", accepts_all=False)
         processor = CommandProcessor([handler], console)
 
         result_handler = processor.get_handler_for_input("unknown command")
         assert result_handler is None
 
-    def test_get_handler_for_input_with_exception(self, console):
+    def test_get_handler_for_input_with_exception(self, console, handler_factory):
         """Test get_handler_for_input when handler raises exception."""
-        handler = HandlerTypeA("FailingHandler")
+        handler = handler_factory("HandlerTypeA")
         handler.set_can_handle_exception(ValueError("test error"))
 
         processor = CommandProcessor([handler], console)
@@ -483,12 +471,12 @@ class TestDebuggingFeatures:
 
         assert result is None
 
-    def test_test_routing(self, console):
+    def test_test_routing(self, console, handler_factory):
         """Test command routing testing functionality."""
-        handler1 = HandlerTypeA("Handler1")
+        handler1 = handler_factory("HandlerTypeA")
         handler1.set_custom_can_handle(lambda x: x.startswith("cmd1"))
 
-        handler2 = HandlerTypeB("Handler2")
+        handler2 = handler_factory("HandlerTypeB")
         handler2.set_custom_can_handle(lambda x: x.startswith("cmd2"))
 
         processor = CommandProcessor([handler1, handler2], console)
@@ -503,9 +491,9 @@ class TestDebuggingFeatures:
         }
         assert routing_results == expected
 
-    def test_test_routing_with_exceptions(self, console):
+    def test_test_routing_with_exceptions(self, console, handler_factory):
         """Test routing test with handlers that raise exceptions."""
-        handler = HandlerTypeA("FailingHandler")
+        handler = handler_factory("HandlerTypeA")
         handler.set_can_handle_exception(RuntimeError("test"))
 
         processor = CommandProcessor([handler], console)
@@ -514,21 +502,21 @@ class TestDebuggingFeatures:
 
         assert routing_results["test command"] == "No Handler"
 
-    def test_string_representation(self, processor):
-        """Test __str__ method."""
-        str_repr = str(processor)
-        assert "CommandProcessor" in str_repr
-        assert "HandlerTypeA" in str_repr
-        assert "processed=0" in str_repr
+    @pytest.mark.parametrize(
+        "render, expected",
+        [
+            (str, ["CommandProcessor", "HandlerTypeA", "processed=0"]),
+            (repr, ["CommandProcessor", "handlers=1", "processed=0", "success_rate="]),
+        ],
+        ids=["str", "repr"],
+    )
+    def test_representations(self, processor, render, expected):
+        """Test __str__ and __repr__ methods."""
+        text = render(processor)
 
-    def test_detailed_representation(self, processor):
-        """Test __repr__ method."""
-        repr_str = repr(processor)
-        assert "CommandProcessor" in repr_str
-        assert "handlers=1" in repr_str
-        assert "processed=0" in repr_str
-        assert "success_rate=" in repr_str
+        for fragment in expected:
+            assert fragment in text
 
 
 if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
+    raise SystemExit(pytest.main([__file__, "-v"]))
@@ -5,306 +5,37 @@ Uses pure pytest - tests controller orchestration and lifecycle management.
 
 import pytest
 from rich.console import Console
-from io import StringIO
 
 # Import the classes to test
+from ifw.cli import controller as _controller
 from ifw.cli.controller import (
     CLIController,
     CLIInitializationError,
     create_cli_controller,
 )
+from ifw.cli.command_processor import CommandProcessingError, NoHandlerFoundError
 
 
-class MockAgent:
-    """Mock agent for testing."""
+def _assert_init_fails(
+    monkeypatch, target, expected_msg, build=CLIController, **kwargs
+):
+    """Make ``target`` fail to construct and assert ``build`` raises for it."""
 
-    def __init__(self):
-        self.messages = []
-        self.call_count = 0
+    def failing_factory(*args):
+        raise Exception(f"{target} initialization failed")
 
-    def __call__(self, user_input):
-        self.call_count += 1
-        return f"AI response to: {user_input}"
+    monkeypatch.setattr(_controller, target, failing_factory)
 
-
-class MockShellExecutor:
-    """Mock shell executor for testing."""
-
-    def __init__(self):
-        self.executed_commands = []
-        self.interrupt_called = False
-        self.should_interrupt = True
-
-    def execute_shell_command(self, command):
-        self.executed_commands.append(command)
-        return f"Output of: {command}"
-
-    def interrupt_current_command(self):
-        self.interrupt_called = True
-        return self.should_interrupt
-
-
-class MockShellDetector:
-    """Mock shell detector for testing."""
-
-    def __init__(self):
-        self.is_shell_responses = {}
-
-    def is_shell_command(self, command):
-        return self.is_shell_responses.get(command, False)
-
-    def set_shell_command(self, command, is_shell=True):
-        self.is_shell_responses[command] = is_shell
-
-
-class MockSessionManager:
-    """Mock session manager for testing."""
-
-    def __init__(self, shell_executor=None, console=None):
-        self.input_queue = []
-        self.input_index = 0
-        self.context = {"username": "testuser", "cwd": "/test"}
-        self.session_info = {"commands_run": 0}
-        self.shell_executor = shell_executor
-        self.console = console
-
-    def get_user_input(self):
-        if self.input_index < len(self.input_queue):
-            result = self.input_queue[self.input_index]
-            self.input_index += 1
-            return result
-        raise EOFError("No more input")
-
-    def add_input(self, user_input):
-        self.input_queue.append(user_input)
-
-    def get_context(self):
-        return self.context
-
-    def get_session_info(self):
-        return self.session_info
-
-    def force_context_refresh(self):
-        pass
-
-
-class MockHandler:
-    """Mock handler for testing."""
-
-    def __init__(self, name, can_handle_result=True, handle_result=True):
-        self.name = name
-        self.can_handle_result = can_handle_result
-        self.handle_result = handle_result
-        self.handled_commands = []
-        self.can_handle_calls = []
-
-    def can_handle(self, user_input):
-        self.can_handle_calls.append(user_input)
-        if callable(self.can_handle_result):
-            return self.can_handle_result(user_input)
-        return self.can_handle_result
-
-    def handle(self, user_input):
-        self.handled_commands.append(user_input)
-        if callable(self.handle_result):
-            return self.handle_result(user_input)
-        return self.handle_result
-
-
-class MockCommandProcessor:
-    """Mock command processor for testing."""
-
-    def __init__(self, handlers=None, console=None):
-        self.processed_commands = []
-        self.handlers = handlers or []
-        self.console = console
-        self.should_raise = None
-        self.stats = {
-            "total_commands": 0,
-            "successful_commands": 0,
-            "failed_commands": 0,
-            "success_rate": 100.0,
-            "handler_stats": {},
-        }
-
-    def process_command(self, user_input):
-        self.processed_commands.append(user_input)
-        self.stats["total_commands"] += 1
-
-        if self.should_raise:
-            raise self.should_raise
-
-        self.stats["successful_commands"] += 1
-        return True
-
-    def get_processing_stats(self):
-        return self.stats.copy()
-
-    def reset_stats(self):
-        self.stats = {
-            "total_commands": 0,
-            "successful_commands": 0,
-            "failed_commands": 0,
-            "success_rate": 100.0,
-            "handler_stats": {},
-        }
-
-    def add_handler(self, handler, position=None):
-        if position is None:
-            self.handlers.append(handler)
-        else:
-            self.handlers.insert(position, handler)
-
-    def remove_handler(self, handler_class):
-        for i, handler in enumerate(self.handlers):
-            if isinstance(handler, handler_class):
-                self.handlers.pop(i)
-                return True
-        return False
-
-    def list_handlers(self):
-        return [h.__class__.__name__ for h in self.handlers]
-
-
-# Mock implementations that will replace real classes
-def mock_session_manager_factory(shell_executor, console):
-    return MockSessionManager(shell_executor, console)
-
-
-def mock_command_processor_factory(handlers, console):
-    return MockCommandProcessor(handlers, console)
-
-
-def mock_shell_executor_factory():
-    return MockShellExecutor()
-
-
-def mock_shell_detector_factory():
-    return MockShellDetector()
-
-
-def mock_control_handler_factory(shell_executor, console):
-    return MockHandler("ControlHandler")
-
-
-def mock_shell_handler_factory(agent, shell_executor, shell_detector, console):
-    return MockHandler("ShellHandler")
-
-
-def mock_ai_handler_factory(agent, shell_executor, console):
-    return MockHandler("AIHandler")
-
-
-# Fixtures
-@pytest.fixture
-def mock_agent():
-    """Provide a mock agent."""
-    return MockAgent()
-
-
-@pytest.fixture
-def console():
-    """Provide a console for testing."""
-    return Console()
-
-
-@pytest.fixture
-def string_console():
-    """Provide a console that captures output."""
-    string_io = StringIO()
-    return Console(file=string_io, force_terminal=False)
-
-
-@pytest.fixture
-def mock_cli_controller(monkeypatch):
-    """Provide a CLIController with all dependencies mocked."""
-    # Create mock agent
-    mock_agent = MockAgent()
-    console = Console()
-
-    # Mock all the imports
-    monkeypatch.setattr(
-        "ifw.cli.controller.SessionManager", mock_session_manager_factory
-    )
-    monkeypatch.setattr(
-        "ifw.cli.controller.CommandProcessor", mock_command_processor_factory
-    )
-    monkeypatch.setattr(
-        "ifw.cli.controller.ShellCommandExecutor", mock_shell_executor_factory
-    )
-    monkeypatch.setattr(
-        "ifw.cli.controller.ShellCommandDetector", mock_shell_detector_factory
-    )
-    monkeypatch.setattr(
-        "ifw.cli.controller.ControlCommandHandler", mock_control_handler_factory
-    )
-    monkeypatch.setattr(
-        "ifw.cli.controller.ShellCommandHandler", mock_shell_handler_factory
-    )
-    monkeypatch.setattr("ifw.cli.controller.AIRequestHandler", mock_ai_handler_factory)
-
-    return CLIController(agent=mock_agent, console=console)
-
-
-def create_mock_cli_controller(monkeypatch, mock_agent=None, console=None):
-    """Helper function to create a mock CLI controller."""
-    if mock_agent is None:
-        mock_agent = MockAgent()
-    if console is None:
-        console = Console()
-
-    # Mock all the imports
-    monkeypatch.setattr(
-        "ifw.cli.controller.SessionManager", mock_session_manager_factory
-    )
-    monkeypatch.setattr(
-        "ifw.cli.controller.CommandProcessor", mock_command_processor_factory
-    )
-    monkeypatch.setattr(
-        "ifw.cli.controller.ShellCommandExecutor", mock_shell_executor_factory
-    )
-    monkeypatch.setattr(
-        "ifw.cli.controller.ShellCommandDetector", mock_shell_detector_factory
-    )
-    monkeypatch.setattr(
-        "ifw.cli.controller.ControlCommandHandler", mock_control_handler_factory
-    )
-    monkeypatch.setattr(
-        "ifw.cli.controller.ShellCommandHandler", mock_shell_handler_factory
-    )
-    monkeypatch.setattr("ifw.cli.controller.AIRequestHandler", mock_ai_handler_factory)
-
-    return CLIController(agent=mock_agent, console=console)
+    with pytest.raises(CLIInitializationError, match=expected_msg):
+        build(**kwargs)
 
 
+@pytest.mark.usefixtures("patch_controller_deps")
 class TestCLIControllerInitialization:
     """Test CLIController initialization."""
 
-    def test_successful_initialization(self, mock_agent, console, monkeypatch):
+    def test_successful_initialization(self, mock_agent, console):
         """Test successful CLIController initialization."""
-        # Mock all dependencies
-        monkeypatch.setattr(
-            "ifw.cli.controller.SessionManager", mock_session_manager_factory
-        )
-        monkeypatch.setattr(
-            "ifw.cli.controller.CommandProcessor", mock_command_processor_factory
-        )
-        monkeypatch.setattr(
-            "ifw.cli.controller.ShellCommandExecutor", mock_shell_executor_factory
-        )
-        monkeypatch.setattr(
-            "ifw.cli.controller.ShellCommandDetector", mock_shell_detector_factory
-        )
-        monkeypatch.setattr(
-            "ifw.cli.controller.ControlCommandHandler", mock_control_handler_factory
-        )
-        monkeypatch.setattr(
-            "ifw.cli.controller.ShellCommandHandler", mock_shell_handler_factory
-        )
-        monkeypatch.setattr(
-            "ifw.cli.controller.AIRequestHandler", mock_ai_handler_factory
-        )
-
         controller = CLIController(agent=mock_agent, console=console, debug_mode=True)
 
         assert controller.agent == mock_agent
@@ -314,200 +45,65 @@ class TestCLIControllerInitialization:
         assert controller.exit_requested is False
         assert len(controller.handlers) == 3
 
-    def test_initialization_with_defaults(self, mock_agent, monkeypatch):
+    def test_initialization_with_defaults(self, mock_agent):
         """Test initialization with default parameters."""
-        # Mock all dependencies
-        monkeypatch.setattr(
-            "ifw.cli.controller.SessionManager", mock_session_manager_factory
-        )
-        monkeypatch.setattr(
-            "ifw.cli.controller.CommandProcessor", mock_command_processor_factory
-        )
-        monkeypatch.setattr(
-            "ifw.cli.controller.ShellCommandExecutor", mock_shell_executor_factory
-        )
-        monkeypatch.setattr(
-            "ifw.cli.controller.ShellCommandDetector", mock_shell_detector_factory
-        )
-        monkeypatch.setattr(
-            "ifw.cli.controller.ControlCommandHandler", mock_control_handler_factory
-        )
-        monkeypatch.setattr(
-            "ifw.cli.controller.ShellCommandHandler", mock_shell_handler_factory
-        )
-        monkeypatch.setattr(
-            "ifw.cli.controller.AIRequestHandler", mock_ai_handler_factory
-        )
-
         controller = CLIController(agent=mock_agent)
 
         assert controller.agent == mock_agent
         assert isinstance(controller.console, Console)
         assert controller.debug_mode is False
 
-    def test_initialization_failure_in_components(
-        self, mock_agent, console, monkeypatch
-    ):
-        """Test initialization failure during component setup."""
-
-        def failing_shell_executor():
-            raise Exception("Executor initialization failed")
-
-        # Mock other dependencies normally, but make shell executor fail
-        monkeypatch.setattr(
-            "ifw.cli.controller.SessionManager", mock_session_manager_factory
-        )
-        monkeypatch.setattr(
-            "ifw.cli.controller.CommandProcessor", mock_command_processor_factory
-        )
-        monkeypatch.setattr(
-            "ifw.cli.controller.ShellCommandExecutor", failing_shell_executor
-        )
-        monkeypatch.setattr(
-            "ifw.cli.controller.ShellCommandDetector", mock_shell_detector_factory
-        )
-        monkeypatch.setattr(
-            "ifw.cli.controller.ControlCommandHandler", mock_control_handler_factory
-        )
-        monkeypatch.setattr(
-            "ifw.cli.controller.ShellCommandHandler", mock_shell_handler_factory
-        )
-        monkeypatch.setattr(
-            "ifw.cli.controller.AIRequestHandler", mock_ai_handler_factory
-        )
-
-        with pytest.raises(CLIInitializationError) as exc_info:
-            CLIController(agent=mock_agent, console=console)
-
-        assert "Failed to initialize CLI" in str(exc_info.value)
-        assert "Executor initialization failed" in str(exc_info.value)
-
-    def test_initialization_failure_in_handlers(self, mock_agent, console, monkeypatch):
-        """Test initialization failure during handler setup."""
-
-        def failing_control_handler(shell_executor, console):
-            raise Exception("Control handler initialization failed")
-
-        # Mock dependencies normally, but make control handler fail
-        monkeypatch.setattr(
-            "ifw.cli.controller.SessionManager", mock_session_manager_factory
-        )
-        monkeypatch.setattr(
-            "ifw.cli.controller.CommandProcessor", mock_command_processor_factory
-        )
-        monkeypatch.setattr(
-            "ifw.cli.controller.ShellCommandExecutor", mock_shell_executor_factory
-        )
-        monkeypatch.setattr(
-            "ifw.cli.controller.ShellCommandDetector", mock_shell_detector_factory
-        )
-        monkeypatch.setattr(
-            "ifw.cli.controller.ControlCommandHandler", failing_control_handler
-        )
-        monkeypatch.setattr(
-            "ifw.cli.controller.ShellCommandHandler", mock_shell_handler_factory
-        )
-        monkeypatch.setattr(
-            "ifw.cli.controller.AIRequestHandler", mock_ai_handler_factory
-        )
-
-        with pytest.raises(CLIInitializationError) as exc_info:
-            CLIController(agent=mock_agent, console=console)
-
-        assert "Failed to initialize handlers" in str(exc_info.value)
-
-    def test_initialization_failure_in_processors(
-        self, mock_agent, console, monkeypatch
+    @pytest.mark.parametrize(
+        "target, stage_message",
+        [
+            ("ShellCommandExecutor", "Failed to initialize core components"),
+            ("ControlCommandHandler", "Failed to initialize handlers"),
+            ("CommandProcessor", "Failed to initialize command processor"),
+        ],
+        ids=["components", "handlers", "processors"],
+    )
+    def test_initialization_failure(
+        self, mock_agent, console, monkeypatch, target, stage_message
     ):
-        """Test initialization failure during processor setup."""
-
-        def failing_command_processor(handlers, console):
-            raise Exception("Processor initialization failed")
-
-        # Mock dependencies normally, but make command processor fail
-        monkeypatch.setattr(
-            "ifw.cli.controller.SessionManager", mock_session_manager_factory
-        )
-        monkeypatch.setattr(
-            "ifw.cli.controller.CommandProcessor", failing_command_processor
-        )
-        monkeypatch.setattr(
-            "ifw.cli.controller.ShellCommandExecutor", mock_shell_executor_factory
-        )
-        monkeypatch.setattr(
-            "ifw.cli.controller.ShellCommandDetector", mock_shell_detector_factory
-        )
-        monkeypatch.setattr(
-            "ifw.cli.controller.ControlCommandHandler", mock_control_handler_factory
+        """Test initialization failure in each setup stage."""
+        _assert_init_fails(
+            monkeypatch,
+            target,
+            f"Failed to initialize CLI: {stage_message}: {target} initialization",
+            agent=mock_agent,
+            console=console,
         )
-        monkeypatch.setattr(
-            "ifw.cli.controller.ShellCommandHandler", mock_shell_handler_factory
-        )
-        monkeypatch.setattr(
-            "ifw.cli.controller.AIRequestHandler", mock_ai_handler_factory
-        )
-
-        with pytest.raises(CLIInitializationError) as exc_info:
-            CLIController(agent=mock_agent, console=console)
-
-        assert "Failed to initialize command processor" in str(exc_info.value)
 
 
 class TestCLIControllerRunMethod:
     """Test CLIController run method and main loop."""
 
-    def test_run_with_single_command(self, monkeypatch):
-        """Test running CLI with a single command."""
-        controller = create_mock_cli_controller(monkeypatch)
-
-        # Add input to session manager
-        controller.session_manager.add_input("test command")
+    @pytest.mark.parametrize(
+        "inputs, expected",
+        [
+            (["test command"], ["test command"]),
+            (
+                ["command1", "command2", "command3"],
+                ["command1", "command2", "command3"],
+            ),
+            (["", "   ", "real command"], ["real command"]),
+        ],
+        ids=["single", "multiple", "empty_skipped"],
+    )
+    def test_run_processes_inputs(self, mock_cli_controller, inputs, expected):
+        """Test that run processes queued input in order, skipping empty input."""
+        controller = mock_cli_controller
+        for user_input in inputs:
+            controller.session_manager.add_input(user_input)
 
-        # Run the CLI
         controller.run()
 
-        # Verify command was processed
-        assert len(controller.command_processor.processed_commands) == 1
-        assert controller.command_processor.processed_commands[0] == "test command"
+        assert controller.command_processor.processed_commands == expected
         assert not controller.running
 
-    def test_run_with_multiple_commands(self, monkeypatch):
-        """Test running CLI with multiple commands."""
-        controller = create_mock_cli_controller(monkeypatch)
-
-        # Add multiple inputs
-        controller.session_manager.add_input("command1")
-        controller.session_manager.add_input("command2")
-        controller.session_manager.add_input("command3")
-
-        controller.run()
-
-        # Verify all commands were processed
-        assert len(controller.command_processor.processed_commands) == 3
-        assert controller.command_processor.processed_commands == [
-            "command1",
-            "command2",
-            "command3",
-        ]
-
-    def test_run_with_empty_input_skipped(self, monkeypatch):
-        """Test that empty input is skipped."""
-        controller = create_mock_cli_controller(monkeypatch)
-
-        # Add empty and whitespace inputs
-        controller.session_manager.add_input("")
-        controller.session_manager.add_input("   ")
-        controller.session_manager.add_input("real command")
-
-        controller.run()
-
-        # Only the real command should be processed
-        assert len(controller.command_processor.processed_commands) == 1
-        assert controller.command_processor.processed_commands[0] == "real command"
-
-    def test_run_handles_eof_gracefully(self, monkeypatch):
+    def test_run_handles_eof_gracefully(self, mock_cli_controller):
         """Test that EOFError (Ctrl+D) is handled gracefully."""
-        controller = create_mock_cli_controller(monkeypatch)
+        controller = mock_cli_controller
 
         # No input added, so EOFError will be raised immediately
         controller.run()
@@ -515,51 +111,35 @@ class TestCLIControllerRunMethod:
         assert controller.exit_requested
         assert not controller.running
 
-    def test_run_handles_keyboard_interrupt(self, monkeypatch):
+    def test_run_handles_keyboard_interrupt(self, mock_cli_controller):
         """Test that KeyboardInterrupt is handled gracefully."""
-        controller = create_mock_cli_controller(monkeypatch)
-
-        # Track how many times get_user_input is called to prevent infinite loop
-        call_count = 0
-
-        def raise_keyboard_interrupt():
-            nonlocal call_count
-            call_count += 1
-            if call_count == 1:
-                raise KeyboardInterrupt()
-            else:
-                # After the first KeyboardInterrupt, raise EOFError to exit
-                raise EOFError()
-
-        # Mock session manager to raise KeyboardInterrupt then EOF
-        monkeypatch.setattr(
-            controller.session_manager, "get_user_input", raise_keyboard_interrupt
-        )
+        controller = mock_cli_controller
+
+        # Raise KeyboardInterrupt once, then EOFError from the empty queue
+        controller.session_manager.add_input(KeyboardInterrupt())
 
         controller.run()
 
         # Should handle interrupt and then exit on EOF
+        assert controller.shell_executor.interrupt_called
+        assert controller.exit_requested
         assert not controller.running
-        assert call_count >= 1
 
 
 class TestCLIControllerCommandProcessing:
     """Test command processing functionality."""
 
-    def test_process_command_success(self, monkeypatch):
+    def test_process_command_success(self, mock_cli_controller):
         """Test successful command processing."""
-        controller = create_mock_cli_controller(monkeypatch)
+        controller = mock_cli_controller
 
         controller._process_command("test command")
 
-        assert len(controller.command_processor.processed_commands) == 1
-        assert controller.command_processor.processed_commands[0] == "test command"
+        assert controller.command_processor.processed_commands == ["test command"]
 
-    def test_process_command_with_command_processing_error(self, monkeypatch):
+    def test_process_command_with_command_processing_error(self, mock_cli_controller):
         """Test handling of CommandProcessingError."""
-        from ifw.cli.command_processor import CommandProcessingError
-
-        controller = create_mock_cli_controller(monkeypatch)
+        controller = mock_cli_controller
 
         # Make command processor raise error
         controller.command_processor.should_raise = CommandProcessingError(
@@ -571,11 +151,9 @@ class TestCLIControllerCommandProcessing:
 
         assert len(controller.command_processor.processed_commands) == 1
 
-    def test_process_command_with_no_handler_found_error(self, monkeypatch):
+    def test_process_command_with_no_handler_found_error(self, mock_cli_controller):
         """Test handling of NoHandlerFoundError."""
-        from ifw.cli.command_processor import NoHandlerFoundError
-
-        controller = create_mock_cli_controller(monkeypatch)
+        controller = mock_cli_controller
 
         # Make command processor raise error
         controller.command_processor.should_raise = NoHandlerFoundError("No handler")
@@ -585,9 +163,9 @@ class TestCLIControllerCommandProcessing:
 
         assert len(controller.command_processor.processed_commands) == 1
 
-    def test_process_command_with_unexpected_error(self, monkeypatch):
+    def test_process_command_with_unexpected_error(self, mock_cli_controller):
         """Test handling of unexpected errors."""
-        controller = create_mock_cli_controller(monkeypatch)
+        controller = mock_cli_controller
 
         # Make command processor raise unexpected error
         controller.command_processor.should_raise = RuntimeError("Unexpected error")
@@ -601,9 +179,9 @@ class TestCLIControllerCommandProcessing:
 class TestCLIControllerInterruptHandling:
     """Test interrupt and signal handling."""
 
-    def test_handle_keyboard_interrupt_with_shell_interrupt(self, monkeypatch):
+    def test_handle_keyboard_interrupt_with_shell_interrupt(self, mock_cli_controller):
         """Test keyboard interrupt when shell command can be interrupted."""
-        controller = create_mock_cli_controller(monkeypatch)
+        controller = mock_cli_controller
         controller.shell_executor.should_interrupt = True
 
         controller._handle_keyboard_interrupt()
@@ -612,9 +190,11 @@ class TestCLIControllerInterruptHandling:
         # Should not exit, just interrupt current command
         assert not controller.exit_requested
 
-    def test_handle_keyboard_interrupt_without_shell_interrupt(self, monkeypatch):
+    def test_handle_keyboard_interrupt_without_shell_interrupt(
+        self, mock_cli_controller
+    ):
         """Test keyboard interrupt when no shell command to interrupt."""
-        controller = create_mock_cli_controller(monkeypatch)
+        controller = mock_cli_controller
         controller.shell_executor.should_interrupt = False
 
         controller._handle_keyboard_interrupt()
@@ -622,25 +202,25 @@ class TestCLIControllerInterruptHandling:
         assert controller.shell_executor.interrupt_called
         assert not controller.exit_requested
 
-    def test_handle_command_interrupt(self, monkeypatch):
+    def test_handle_command_interrupt(self, mock_cli_controller):
         """Test handling interrupt during command processing."""
-        controller = create_mock_cli_controller(monkeypatch)
+        controller = mock_cli_controller
 
         controller._handle_command_interrupt()
 
         assert controller.shell_executor.interrupt_called
 
-    def test_handle_eof(self, monkeypatch):
+    def test_handle_eof(self, mock_cli_controller):
         """Test handling EOF (Ctrl+D)."""
-        controller = create_mock_cli_controller(monkeypatch)
+        controller = mock_cli_controller
 
         controller._handle_eof()
 
         assert controller.exit_requested
 
-    def test_handle_unexpected_error(self, monkeypatch):
+    def test_handle_unexpected_error(self, mock_cli_controller):
         """Test handling unexpected errors in main loop."""
-        controller = create_mock_cli_controller(monkeypatch)
+        controller = mock_cli_controller
         test_error = RuntimeError("Unexpected error")
 
         controller._handle_unexpected_error(test_error)
@@ -651,9 +231,9 @@ class TestCLIControllerInterruptHandling:
 class TestCLIControllerLifecycle:
     """Test CLI lifecycle management."""
 
-    def test_stop_method(self, monkeypatch):
+    def test_stop_method(self, mock_cli_controller):
         """Test stopping the CLI gracefully."""
-        controller = create_mock_cli_controller(monkeypatch)
+        controller = mock_cli_controller
         controller.running = True
 
         controller.stop()
@@ -661,9 +241,9 @@ class TestCLIControllerLifecycle:
         assert controller.exit_requested
         assert not controller.running
 
-    def test_cleanup_method(self, monkeypatch):
+    def test_cleanup_method(self, mock_cli_controller):
         """Test cleanup functionality."""
-        controller = create_mock_cli_controller(monkeypatch)
+        controller = mock_cli_controller
         controller.running = True
 
         controller._cleanup()
@@ -674,9 +254,9 @@ class TestCLIControllerLifecycle:
 class TestCLIControllerStatistics:
     """Test statistics and monitoring functionality."""
 
-    def test_get_statistics(self, monkeypatch):
+    def test_get_statistics(self, mock_cli_controller):
         """Test getting comprehensive statistics."""
-        controller = create_mock_cli_controller(monkeypatch)
+        controller = mock_cli_controller
 
         stats = controller.get_statistics()
 
@@ -693,9 +273,9 @@ class TestCLIControllerStatistics:
         # Check session info
         assert stats["session"] == {"commands_run": 0}
 
-    def test_reset_statistics(self, monkeypatch):
+    def test_reset_statistics(self, mock_cli_controller):
         """Test resetting statistics."""
-        controller = create_mock_cli_controller(monkeypatch)
+        controller = mock_cli_controller
 
         # Process a command first
         controller._process_command("test")
@@ -710,11 +290,11 @@ class TestCLIControllerStatistics:
 class TestCLIControllerHandlerManagement:
     """Test handler management functionality."""
 
-    def test_add_handler(self, monkeypatch):
+    def test_add_handler(self, mock_cli_controller, mock_handler_cls):
         """Test adding a new handler."""
-        controller = create_mock_cli_controller(monkeypatch)
+        controller = mock_cli_controller
 
-        new_handler = MockHandler("NewHandler")
+        new_handler = mock_handler_cls("NewHandler")
         initial_count = len(controller.handlers)
 
         controller.add_handler(new_handler)
@@ -722,35 +302,35 @@ class TestCLIControllerHandlerManagement:
         assert len(controller.handlers) == initial_count + 1
         assert new_handler in controller.command_processor.handlers
 
-    def test_add_handler_at_position(self, monkeypatch):
+    def test_add_handler_at_position(self, mock_cli_controller, mock_handler_cls):
         """Test adding handler at specific position."""
-        controller = create_mock_cli_controller(monkeypatch)
+        controller = mock_cli_controller
 
-        new_handler = MockHandler("NewHandler")
+        new_handler = mock_handler_cls("NewHandler")
 
         controller.add_handler(new_handler, position=1)
 
         assert controller.command_processor.handlers[1] == new_handler
 
-    def test_remove_handler(self, monkeypatch):
+    def test_remove_handler(self, mock_cli_controller, mock_handler_cls):
         """Test removing a handler."""
-        controller = create_mock_cli_controller(monkeypatch)
+        controller = mock_cli_controller
 
         initial_count = len(controller.handlers)
 
         # Add a handler first
-        test_handler = MockHandler("TestHandler")
+        test_handler = mock_handler_cls("TestHandler")
         controller.add_handler(test_handler)
 
         # Remove it
-        result = controller.remove_handler(MockHandler)
+        result = controller.remove_handler(mock_handler_cls)
 
         assert result is True
         assert len(controller.handlers) == initial_count
 
-    def test_remove_nonexistent_handler(self, monkeypatch):
+    def test_remove_nonexistent_handler(self, mock_cli_controller):
         """Test removing a handler that doesn't exist."""
-        controller = create_mock_cli_controller(monkeypatch)
+        controller = mock_cli_controller
 
         class NonExistentHandler:
             pass
@@ -763,9 +343,9 @@ class TestCLIControllerHandlerManagement:
 class TestCLIControllerUtilityMethods:
     """Test utility and helper methods."""
 
-    def test_set_debug_mode(self, monkeypatch):
+    def test_set_debug_mode(self, mock_cli_controller):
         """Test setting debug mode."""
-        controller = create_mock_cli_controller(monkeypatch)
+        controller = mock_cli_controller
 
         assert controller.debug_mode is False
 
@@ -775,71 +355,53 @@ class TestCLIControllerUtilityMethods:
         controller.set_debug_mode(False)
         assert controller.debug_mode is False
 
-    def test_get_session_context(self, monkeypatch):
+    def test_get_session_context(self, mock_cli_controller):
         """Test getting session context."""
-        controller = create_mock_cli_controller(monkeypatch)
+        controller = mock_cli_controller
 
         context = controller.get_session_context()
 
         assert context == {"username": "testuser", "cwd": "/test"}
 
-    def test_force_context_refresh(self, monkeypatch):
+    def test_force_context_refresh(self, mock_cli_controller):
         """Test forcing context refresh."""
-        controller = create_mock_cli_controller(monkeypatch)
+        controller = mock_cli_controller
 
         # Should not raise any errors
         controller.force_context_refresh()
 
-    def test_string_representation(self, monkeypatch):
-        """Test __str__ method."""
-        controller = create_mock_cli_controller(monkeypatch)
-
-        str_repr = str(controller)
-
-        assert "CLIController" in str_repr
-        assert "running=False" in str_repr
-        assert "testuser" in str_repr
-
-    def test_detailed_representation(self, monkeypatch):
-        """Test __repr__ method."""
-        controller = create_mock_cli_controller(monkeypatch)
+    @pytest.mark.parametrize(
+        "render, expected",
+        [
+            (str, ["CLIController", "running=False", "testuser"]),
+            (
+                repr,
+                [
+                    "CLIController",
+                    "running=False",
+                    "handlers=3",
+                    "commands_processed=0",
+                ],
+            ),
+        ],
+        ids=["str", "repr"],
+    )
+    def test_representations(self, mock_cli_controller, render, expected):
+        """Test __str__ and __repr__ methods."""
+        controller = mock_cli_controller
 
-        repr_str = repr(controller)
+        text = render(controller)
 
-        assert "CLIController" in repr_str
-        assert "running=False" in repr_str
-        assert "handlers=3" in repr_str
-        assert "commands_processed=0" in repr_str
+        for fragment in expected:
+            assert fragment in text
 
 
+@pytest.mark.usefixtures("patch_controller_deps")
 class TestCreateCLIControllerFactory:
     """Test the factory function for creating CLI controllers."""
 
-    def test_create_cli_controller_success(self, mock_agent, console, monkeypatch):
+    def test_create_cli_controller_success(self, mock_agent, console):
         """Test successful CLI controller creation via factory."""
-        # Mock all dependencies
-        monkeypatch.setattr(
-            "ifw.cli.controller.SessionManager", mock_session_manager_factory
-        )
-        monkeypatch.setattr(
-            "ifw.cli.controller.CommandProcessor", mock_command_processor_factory
-        )
-        monkeypatch.setattr(
-            "ifw.cli.controller.ShellCommandExecutor", mock_shell_executor_factory
-        )
-        monkeypatch.setattr(
-            "ifw.cli.controller.ShellCommandDetector", mock_shell_detector_factory
-        )
-        monkeypatch.setattr(
-            "ifw.cli.controller.ControlCommandHandler", mock_control_handler_factory
-        )
-        monkeypatch.setattr(
-            "ifw.cli.controller.ShellCommandHandler", mock_shell_handler_factory
-        )
-        monkeypatch.setattr(
-            "ifw.cli.controller.AIRequestHandler", mock_ai_handler_factory
-        )
-
         controller = create_cli_controller(
             agent=mock_agent, console=console, debug_mode=True
         )
@@ -849,31 +411,8 @@ class TestCreateCLIControllerFactory:
         assert controller.console == console
         assert controller.debug_mode is True
 
-    def test_create_cli_controller_with_defaults(self, mock_agent, monkeypatch):
+    def test_create_cli_controller_with_defaults(self, mock_agent):
         """Test factory with default parameters."""
-        # Mock all dependencies
-        monkeypatch.setattr(
-            "ifw.cli.controller.SessionManager", mock_session_manager_factory
-        )
-        monkeypatch.setattr(
-            "ifw.cli.controller.CommandProcessor", mock_command_processor_factory
-        )
-        monkeypatch.setattr(
-            "ifw.cli.controller.ShellCommandExecutor", mock_shell_executor_factory
-        )
-        monkeypatch.setattr(
-            "ifw.cli.controller.ShellCommandDetector", mock_shell_detector_factory
-        )
-        monkeypatch.setattr(
-            "ifw.cli.controller.ControlCommandHandler", mock_control_handler_factory
-        )
-        monkeypatch.setattr(
-            "ifw.cli.controller.ShellCommandHandler", mock_shell_handler_factory
-        )
-        monkeypatch.setattr(
-            "ifw.cli.controller.AIRequestHandler", mock_ai_handler_factory
-        )
-
         controller = create_cli_controller(agent=mock_agent)
 
         assert isinstance(controller, CLIController)
@@ -884,35 +423,14 @@ class TestCreateCLIControllerFactory:
         self, mock_agent, console, monkeypatch
     ):
         """Test factory when initialization fails."""
-
-        def failing_shell_executor():
-            raise Exception("Initialization failed")
-
-        # Mock dependencies with one failing
-        monkeypatch.setattr(
-            "ifw.cli.controller.SessionManager", mock_session_manager_factory
-        )
-        monkeypatch.setattr(
-            "ifw.cli.controller.CommandProcessor", mock_command_processor_factory
-        )
-        monkeypatch.setattr(
-            "ifw.cli.controller.ShellCommandExecutor", failing_shell_executor
+        _assert_init_fails(
+            monkeypatch,
+            "ShellCommandExecutor",
+            "Failed to initialize CLI",
+            build=create_cli_controller,
+            agent=mock_agent,
+            console=console,
         )
-        monkeypatch.setattr(
-            "ifw.cli.controller.ShellCommandDetector", mock_shell_detector_factory
-        )
-        monkeypatch.setattr(
-            "ifw.cli.controller.ControlCommandHandler", mock_control_handler_factory
-        )
-        monkeypatch.setattr(
-            "ifw.cli.controller.ShellCommandHandler", mock_shell_handler_factory
-        )
-        monkeypatch.setattr(
-            "ifw.cli.controller.AIRequestHandler", mock_ai_handler_factory
-        )
-
-        with pytest.raises(CLIInitializationError):
-            create_cli_controller(agent=mock_agent, console=console)
 
 
 if __name__ == "__main__":
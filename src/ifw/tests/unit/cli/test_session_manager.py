@@ -3,21 +3,39 @@ Comprehensive unit test suite for SessionManager class.
 Uses pure pytest - tests session management, prompts, and context handling.
 """
 
+import getpass
+import socket
+from collections import deque
+
 import pytest
 from rich.console import Console
 from io import StringIO
 
 # Import the classes to test
+from ifw.cli import session_manager as _sm
 from ifw.cli.session_manager import SessionManager
 from ifw.utils.exceptions import SessionError
 
+# Keep this module on one xdist worker (with --dist=loadgroup) so the
+# module-scoped _patch_session_deps fixture is applied only once
+pytestmark = pytest.mark.xdist_group(name="session_manager")
+
 
 class MockShellExecutor:
     """Mock shell executor for testing."""
 
+    __slots__ = ("current_directory", "_commands_executed")
+
     def __init__(self):
         self.current_directory = "/home/testuser"
-        self.commands_executed = []
+        # Allocated on first use; most tests never execute a command
+        self._commands_executed = None
+
+    @property
+    def commands_executed(self):
+        if self._commands_executed is None:
+            self._commands_executed = []
+        return self._commands_executed
 
     def get_current_directory(self):
         return self.current_directory
@@ -33,9 +51,17 @@ class MockShellExecutor:
 class MockSmartCompleter:
     """Mock smart completer for testing."""
 
+    __slots__ = ("shell_executor", "_completions")
+
     def __init__(self, shell_executor=None):
         self.shell_executor = shell_executor
-        self.completions = []
+        self._completions = None
+
+    @property
+    def completions(self):
+        if self._completions is None:
+            self._completions = []
+        return self._completions
 
     def get_completions(self, document, complete_event):
         return self.completions
@@ -47,14 +73,22 @@ class MockSmartCompleter:
 class MockInMemoryHistory:
     """Mock in-memory history for testing."""
 
+    __slots__ = ("_commands",)
+
     def __init__(self):
-        self.commands = []
+        self._commands = None
+
+    @property
+    def commands(self):
+        if self._commands is None:
+            self._commands = []
+        return self._commands
 
     def append_string(self, command):
         self.commands.append(command)
 
     def get_strings(self):
-        return self.commands.copy()
+        return list(self.commands)
 
 
 def mock_getuser():
@@ -67,73 +101,99 @@ def mock_gethostname():
     return "testhost"
 
 
-def mock_prompt(prompt_text, **kwargs):
-    """Mock prompt_toolkit.prompt function."""
-    # Store the kwargs for verification in tests
-    mock_prompt.last_call_kwargs = kwargs
-    mock_prompt.last_prompt_text = prompt_text
+def _prime(manager, username="testuser", hostname="testhost", cwd="/home/testuser"):
+    """Fill the manager's context cache directly, marking it valid."""
+    manager._context_cache = {"username": username, "hostname": hostname, "cwd": cwd}
+    manager._context_cache_valid = True
 
-    # Return predefined input or raise exception
-    if hasattr(mock_prompt, "return_value"):
-        result = mock_prompt.return_value
-        # Reset for next call
-        delattr(mock_prompt, "return_value")
-        return result
-    elif hasattr(mock_prompt, "raise_exception"):
-        exception = mock_prompt.raise_exception
-        # Reset for next call
-        delattr(mock_prompt, "raise_exception")
-        raise exception
-    else:
-        return "test command"
+
+def _oserror(msg):
+    """Return a callable that raises OSError(msg) whatever it is called with."""
+
+    def raise_oserror(*args, **kwargs):
+        raise OSError(msg)
+
+    return raise_oserror
+
+
+class _MockPrompt:
+    """Mock prompt_toolkit.prompt function driven by a queue of responses."""
+
+    __slots__ = ("queue", "last_call_kwargs", "last_prompt_text")
+
+    def __init__(self):
+        # (kind, payload) pairs: ("return", value) or ("raise", exception)
+        self.queue = deque()
+        self.reset()
+
+    def reset(self):
+        """Drop queued responses and forget the last call."""
+        self.queue.clear()
+        self.last_call_kwargs = None
+        self.last_prompt_text = None
+
+    def __call__(self, prompt_text, **kwargs):
+        # Store the call for verification in tests
+        self.last_prompt_text = prompt_text
+        self.last_call_kwargs = kwargs
+
+        if not self.queue:
+            return "test command"
+        kind, payload = self.queue.popleft()
+        if kind == "raise":
+            raise payload
+        return payload
+
+
+mock_prompt = _MockPrompt()
 
 
 # Fixtures
+@pytest.fixture(scope="module", autouse=True)
+def _patch_session_deps():
+    """Patch SessionManager's external dependencies once for this module."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(_sm, "InMemoryHistory", MockInMemoryHistory)
+        mp.setattr(_sm, "SmartCompleter", MockSmartCompleter)
+        mp.setattr(getpass, "getuser", mock_getuser)
+        mp.setattr(socket, "gethostname", mock_gethostname)
+        mp.setattr(_sm, "prompt", mock_prompt)
+        yield
+
+
 @pytest.fixture
 def mock_shell_executor():
     """Provide a mock shell executor."""
     return MockShellExecutor()
 
 
-@pytest.fixture
-def console():
-    """Provide a console for testing."""
-    return Console()
+@pytest.fixture(scope="session")
+def _string_console_session():
+    """Build the capturing console once; string_console empties it per test."""
+    return Console(file=StringIO(), force_terminal=False)
 
 
 @pytest.fixture
-def string_console():
-    """Provide a console that captures output."""
-    string_io = StringIO()
-    return Console(file=string_io, force_terminal=False)
+def string_console(_string_console_session):
+    """Provide a console that captures output, starting from an empty buffer."""
+    buffer = _string_console_session.file
+    buffer.seek(0)
+    buffer.truncate()
+    return _string_console_session
 
 
 @pytest.fixture
-def session_manager(mock_shell_executor, console, monkeypatch):
+def session_manager(mock_shell_executor, console):
     """Provide a SessionManager with mocked dependencies."""
-    # Mock external dependencies
-    monkeypatch.setattr("ifw.cli.session_manager.InMemoryHistory", MockInMemoryHistory)
-    monkeypatch.setattr("ifw.cli.session_manager.SmartCompleter", MockSmartCompleter)
-    monkeypatch.setattr("getpass.getuser", mock_getuser)
-    monkeypatch.setattr("socket.gethostname", mock_gethostname)
-    monkeypatch.setattr("ifw.cli.session_manager.prompt", mock_prompt)
-
+    mock_prompt.reset()
     return SessionManager(mock_shell_executor, console)
 
 
 class TestSessionManagerInitialization:
     """Test SessionManager initialization."""
 
-    def test_successful_initialization(self, mock_shell_executor, console, monkeypatch):
+    def test_successful_initialization(self, mock_shell_executor, console):
         """Test successful SessionManager initialization."""
-        # Mock dependencies
-        monkeypatch.setattr(
-            "ifw.cli.session_manager.InMemoryHistory", MockInMemoryHistory
-        )
-        monkeypatch.setattr(
-            "ifw.cli.session_manager.SmartCompleter", MockSmartCompleter
-        )
-
         manager = SessionManager(mock_shell_executor, console)
 
         assert manager.shell_executor == mock_shell_executor
@@ -144,17 +204,9 @@ class TestSessionManagerInitialization:
         assert manager._context_cache_valid is True
 
     def test_initialization_creates_smart_completer_with_shell_executor(
-        self, mock_shell_executor, console, monkeypatch
+        self, mock_shell_executor, console
     ):
         """Test that SmartCompleter is initialized with shell executor."""
-        mock_completer_class = MockSmartCompleter
-        monkeypatch.setattr(
-            "ifw.cli.session_manager.InMemoryHistory", MockInMemoryHistory
-        )
-        monkeypatch.setattr(
-            "ifw.cli.session_manager.SmartCompleter", mock_completer_class
-        )
-
         manager = SessionManager(mock_shell_executor, console)
 
         assert manager.smart_completer.shell_executor == mock_shell_executor
@@ -163,24 +215,24 @@ class TestSessionManagerInitialization:
 class TestSessionManagerUserInput:
     """Test user input functionality."""
 
-    def test_get_user_input_success(self, session_manager, monkeypatch):
+    def test_get_user_input_success(self, session_manager):
         """Test successful user input."""
         # Set up mock prompt to return specific input
-        mock_prompt.return_value = "test command"
+        mock_prompt.queue.append(("return", "test command"))
 
         result = session_manager.get_user_input()
 
         assert result == "test command"
         assert not session_manager._context_cache_valid  # Cache should be invalidated
 
-    def test_get_user_input_with_formatted_prompt(self, session_manager, monkeypatch):
+    def test_get_user_input_with_formatted_prompt(self, session_manager):
         """Test that prompt is formatted correctly."""
-        mock_prompt.return_value = "test"
+        mock_prompt.queue.append(("return", "test"))
 
         session_manager.get_user_input()
 
         # Check that prompt was called with correct parameters
-        assert hasattr(mock_prompt, "last_call_kwargs")
+        assert mock_prompt.last_call_kwargs is not None
         kwargs = mock_prompt.last_call_kwargs
 
         assert "completer" in kwargs
@@ -191,29 +243,26 @@ class TestSessionManagerUserInput:
         assert kwargs["enable_history_search"] is True
         assert kwargs["complete_while_typing"] is False
 
-    def test_get_user_input_keyboard_interrupt(self, session_manager):
-        """Test that KeyboardInterrupt is properly propagated."""
-        mock_prompt.raise_exception = KeyboardInterrupt()
+    @pytest.mark.parametrize(
+        "error", [KeyboardInterrupt, EOFError], ids=["keyboard_interrupt", "eof"]
+    )
+    def test_get_user_input_propagates_control_errors(self, session_manager, error):
+        """Test that KeyboardInterrupt and EOFError are properly propagated."""
+        mock_prompt.queue.append(("raise", error()))
 
-        with pytest.raises(KeyboardInterrupt):
-            session_manager.get_user_input()
-
-    def test_get_user_input_eof_error(self, session_manager):
-        """Test that EOFError is properly propagated."""
-        mock_prompt.raise_exception = EOFError()
-
-        with pytest.raises(EOFError):
+        with pytest.raises(error):
             session_manager.get_user_input()
 
     def test_get_user_input_unexpected_error(self, session_manager):
         """Test that unexpected errors are wrapped in SessionError."""
-        mock_prompt.raise_exception = RuntimeError("Unexpected error")
+        mock_prompt.queue.append(("raise", RuntimeError("Unexpected error")))
 
         with pytest.raises(SessionError) as exc_info:
             session_manager.get_user_input()
 
-        assert "Failed to get user input" in str(exc_info.value)
-        assert "Unexpected error" in str(exc_info.value)
+        message = str(exc_info.value)
+        assert "Failed to get user input" in message
+        assert "Unexpected error" in message
 
 
 class TestSessionManagerContext:
@@ -234,12 +283,13 @@ class TestSessionManagerContext:
 
     def test_get_context_uses_cache(self, session_manager, monkeypatch):
         """Test that context uses cache when valid."""
-        # First call to populate cache
-        context1 = session_manager.get_context()
+        # Populate cache
+        _prime(session_manager)
+        context1 = dict(session_manager._context_cache)
 
         # Mock functions to return different values
-        monkeypatch.setattr("getpass.getuser", lambda: "different_user")
-        monkeypatch.setattr("socket.gethostname", lambda: "different_host")
+        monkeypatch.setattr(getpass, "getuser", lambda: "different_user")
+        monkeypatch.setattr(socket, "gethostname", lambda: "different_host")
         session_manager.shell_executor.set_current_directory("/different/path")
 
         # Second call should use cache
@@ -257,8 +307,8 @@ class TestSessionManagerContext:
         session_manager._invalidate_context_cache()
 
         # Mock functions to return different values
-        monkeypatch.setattr("getpass.getuser", lambda: "new_user")
-        monkeypatch.setattr("socket.gethostname", lambda: "new_host")
+        monkeypatch.setattr(getpass, "getuser", lambda: "new_user")
+        monkeypatch.setattr(socket, "gethostname", lambda: "new_host")
         session_manager.shell_executor.set_current_directory("/new/path")
 
         # Second call should get fresh values
@@ -276,9 +326,7 @@ class TestSessionManagerContext:
         session_manager.console = string_console
 
         # Mock functions to raise errors
-        monkeypatch.setattr(
-            "getpass.getuser", lambda: exec('raise OSError("User error")')
-        )
+        monkeypatch.setattr(getpass, "getuser", _oserror("User error"))
 
         context = session_manager.get_context()
 
@@ -291,12 +339,12 @@ class TestSessionManagerContext:
 
     def test_force_context_refresh(self, session_manager, monkeypatch):
         """Test force context refresh functionality."""
-        # First call to populate cache
-        context1 = session_manager.get_context()
-        assert session_manager._context_cache_valid is True
+        # Populate cache
+        _prime(session_manager)
+        context1 = dict(session_manager._context_cache)
 
         # Change underlying values
-        monkeypatch.setattr("getpass.getuser", lambda: "refreshed_user")
+        monkeypatch.setattr(getpass, "getuser", lambda: "refreshed_user")
         session_manager.shell_executor.set_current_directory("/refreshed/path")
 
         # Force refresh
@@ -360,7 +408,7 @@ class TestSessionManagerCacheManagement:
         assert session_manager._context_cache_valid is True
 
         # Get user input (should invalidate cache)
-        mock_prompt.return_value = "test"
+        mock_prompt.queue.append(("return", "test"))
         session_manager.get_user_input()
 
         assert session_manager._context_cache_valid is False
@@ -414,29 +462,17 @@ class TestSessionManagerSessionInfo:
 class TestSessionManagerCompletionMode:
     """Test completion mode functionality."""
 
-    def test_set_completion_mode_real_time_true(self, session_manager):
-        """Test setting completion mode to real-time."""
-        session_manager.set_completion_mode(real_time=True)
-
-        # Check that preference is stored
-        assert hasattr(session_manager, "_real_time_completion")
-        assert session_manager._real_time_completion is True
-
-    def test_set_completion_mode_real_time_false(self, session_manager):
-        """Test setting completion mode to non-real-time."""
-        session_manager.set_completion_mode(real_time=False)
+    @pytest.mark.parametrize(
+        "kwargs, expected",
+        [({"real_time": True}, True), ({"real_time": False}, False), ({}, False)],
+        ids=["real_time_true", "real_time_false", "default"],
+    )
+    def test_set_completion_mode(self, session_manager, kwargs, expected):
+        """Test setting completion mode, which defaults to non-real-time."""
+        session_manager.set_completion_mode(**kwargs)
 
         # Check that preference is stored
-        assert hasattr(session_manager, "_real_time_completion")
-        assert session_manager._real_time_completion is False
-
-    def test_set_completion_mode_default(self, session_manager):
-        """Test setting completion mode with default parameter."""
-        session_manager.set_completion_mode()
-
-        # Default should be False
-        assert hasattr(session_manager, "_real_time_completion")
-        assert session_manager._real_time_completion is False
+        assert session_manager._real_time_completion is expected
 
 
 class TestSessionManagerEdgeCases:
@@ -449,10 +485,13 @@ class TestSessionManagerEdgeCases:
         session_manager.console = string_console
 
         # Mock shell executor to raise error
-        def failing_get_directory():
+        def failing_get_directory(self):
             raise RuntimeError("Shell executor failed")
 
-        session_manager.shell_executor.get_current_directory = failing_get_directory
+        # Slotted mock: patch the method on the class
+        monkeypatch.setattr(
+            MockShellExecutor, "get_current_directory", failing_get_directory
+        )
 
         context = session_manager.get_context()
 
@@ -468,14 +507,10 @@ class TestSessionManagerEdgeCases:
         session_manager.console = string_console
 
         # Mock all system calls to fail
+        monkeypatch.setattr(getpass, "getuser", _oserror("User failed"))
+        monkeypatch.setattr(socket, "gethostname", _oserror("Hostname failed"))
         monkeypatch.setattr(
-            "getpass.getuser", lambda: exec('raise OSError("User failed")')
-        )
-        monkeypatch.setattr(
-            "socket.gethostname", lambda: exec('raise OSError("Hostname failed")')
-        )
-        session_manager.shell_executor.get_current_directory = lambda: exec(
-            'raise OSError("Directory failed")'
+            MockShellExecutor, "get_current_directory", _oserror("Directory failed")
         )
 
         context = session_manager.get_context()
@@ -492,7 +527,7 @@ class TestSessionManagerEdgeCases:
             return {"username": "", "hostname": "", "cwd": ""}
 
         monkeypatch.setattr(session_manager, "get_context", minimal_context)
-        mock_prompt.return_value = "test"
+        mock_prompt.queue.append(("return", "test"))
 
         result = session_manager.get_user_input()
 
@@ -514,7 +549,7 @@ class TestSessionManagerIntegration:
         assert session_manager._context_cache_valid is True
 
         # Simulate user input (invalidates cache)
-        mock_prompt.return_value = "ls -la"
+        mock_prompt.queue.append(("return", "ls -la"))
         user_input = session_manager.get_user_input()
         assert user_input == "ls -la"
         assert session_manager._context_cache_valid is False
@@ -524,11 +559,11 @@ class TestSessionManagerIntegration:
         assert session_info["cache_valid"] is True  # Refreshed by get_session_info
         assert session_info["completer_active"] is True
 
-    def test_cache_behavior_across_operations(self, session_manager, monkeypatch):
+    def test_cache_behavior_across_operations(self, session_manager):
         """Test cache behavior across multiple operations."""
         # Initial context
-        context1 = session_manager.get_context()
-        assert session_manager._context_cache_valid is True
+        _prime(session_manager)
+        context1 = dict(session_manager._context_cache)
 
         # Change directory via shell executor
         session_manager.shell_executor.set_current_directory("/new/directory")
@@ -538,7 +573,7 @@ class TestSessionManagerIntegration:
         assert context1 == context2  # Still using cache
 
         # Simulate user input (invalidates cache)
-        mock_prompt.return_value = "cd /new/directory"
+        mock_prompt.queue.append(("return", "cd /new/directory"))
         session_manager.get_user_input()
 
         # Now context should be fresh
@@ -551,14 +586,12 @@ class TestSessionManagerIntegration:
         session_manager.console = string_console
 
         # Test recovery from context error
-        monkeypatch.setattr(
-            "getpass.getuser", lambda: exec('raise OSError("Temporary error")')
-        )
+        monkeypatch.setattr(getpass, "getuser", _oserror("Temporary error"))
         context = session_manager.get_context()
         assert context["username"] == "user"  # Fallback
 
         # Test that subsequent operations still work
-        mock_prompt.return_value = "test command"
+        mock_prompt.queue.append(("return", "test command"))
         user_input = session_manager.get_user_input()
         assert user_input == "test command"
 
@@ -1,7 +1,16 @@
+import argparse
+import sys
+
 from ifw.shell.is_shell import ShellCommandDetector
 
 
-def main():
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Score ShellCommandDetector")
+    parser.add_argument(
+        "--verbose", action="store_true", help="also print correctly classified inputs"
+    )
+    verbose = parser.parse_args(argv).verbose
+
     detector = ShellCommandDetector()
 
     # Comprehensive test cases - 100+ new examples
@@ -181,46 +190,51 @@ def main():
         ),
     ]
 
-    print("=" * 80)
-    print("COMPREHENSIVE SHELL COMMAND DETECTOR TEST (100+ CASES)")
-    print("=" * 80)
+    # Classify everything in one pass over a flat list of inputs
+    inputs = [text for _, _, texts in test_cases for text in texts]
+    results = list(map(detector.is_shell_command, inputs))
 
-    total_tests = 0
+    out = ["=" * 80, "COMPREHENSIVE SHELL COMMAND DETECTOR TEST (100+ CASES)", "=" * 80]
+    sys.stdout.write("\n".join(out) + "\n")
+
+    total_tests = len(inputs)
     total_errors = 0
+    start = 0
 
     for category, expected, test_inputs in test_cases:
-        print(f"\n📁 {category} (Expected: {expected})")
-        print("-" * 60)
-
-        category_errors = 0
-        for test_input in test_inputs:
-            result = detector.is_shell_command(test_input)
-            total_tests += 1
+        end = start + len(test_inputs)
+        category_results = results[start:end]
+        category_errors = sum(result != expected for result in category_results)
+        total_errors += category_errors
 
-            if result != expected:
-                status = "❌ WRONG"
-                category_errors += 1
-                total_errors += 1
-            else:
-                status = "✅ OK"
-
-            print(f"{status:8} | '{test_input}' -> {result}")
+        # Misclassified inputs are always listed; correct ones only with --verbose
+        out = [f"\n📁 {category} (Expected: {expected})", "-" * 60]
+        out.extend(
+            f"{'✅ OK' if result == expected else '❌ WRONG':8} | '{text}' -> {result}"
+            for text, result in zip(test_inputs, category_results)
+            if verbose or result != expected
+        )
 
         # Category summary
-        accuracy = ((len(test_inputs) - category_errors) / len(test_inputs)) * 100
-        print(
-            f"\n📊 Category Accuracy: {accuracy:.1f}% ({len(test_inputs) - category_errors}/{len(test_inputs)})"
+        passed = len(test_inputs) - category_errors
+        accuracy = (passed / len(test_inputs)) * 100
+        out.append(
+            f"\n📊 Category Accuracy: {accuracy:.1f}% ({passed}/{len(test_inputs)})"
         )
+        sys.stdout.write("\n".join(out) + "\n")
+        start = end
 
     # Overall summary
-    print("\n" + "=" * 80)
-    overall_accuracy = ((total_tests - total_errors) / total_tests) * 100
-    print(
-        f"🎯 OVERALL ACCURACY: {overall_accuracy:.1f}% ({total_tests - total_errors}/{total_tests})"
-    )
-    print(f"❌ Total Errors: {total_errors}")
-    print(f"📊 Total Test Cases: {total_tests}")
-    print("=" * 80)
+    passed = total_tests - total_errors
+    overall_accuracy = (passed / total_tests) * 100
+    out = [
+        "\n" + "=" * 80,
+        f"🎯 OVERALL ACCURACY: {overall_accuracy:.1f}% ({passed}/{total_tests})",
+        f"❌ Total Errors: {total_errors}",
+        f"📊 Total Test Cases: {total_tests}",
+        "=" * 80,
+    ]
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 if __name__ == "__main__":